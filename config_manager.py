@@ -1,4 +1,7 @@
+import atexit
 import configparser
+import io
+from pathlib import Path
 
 
 class ConfigManager():
@@ -7,6 +10,8 @@ class ConfigManager():
 
     This class handles the creation of a default config file if one
     does not exist and provides methods to access and update settings.
+    Changes are kept in memory until `flush` is called; any pending changes
+    are also written when the interpreter exits.
     """
     _CONFIG_FILE_NAME = 'config.ini'
     default_configs = {
@@ -23,33 +28,53 @@ class ConfigManager():
         file exists with default values if it's the first time running.
         """
         self.config = configparser.ConfigParser()
+        self._dirty = False
         self._load_or_create_defaults()
+        atexit.register(self.flush)
 
     def get_theme(self):
         """Returns the current theme name."""
         return self.config.get('Settings', 'theme')
 
     def set_theme(self, theme_name):
-        """Sets the theme name and saves the config file."""
+        """Sets the theme name. The config file is written on `flush`."""
         self.config.set('Settings', 'theme', theme_name)
-        self._save_configs()
+        self._dirty = True
+
+    def flush(self):
+        """Writes the config file if any setting changed since the last
+        write."""
+        if self._dirty:
+            self._save_configs()
 
     def _load_or_create_defaults(self):
         """
         Loads the config file. If the file is not found, a new one is created
         with default settings.
+
+        The whole file is read with a single call and parsed from memory.
         """
-        if not self.config.read(self._CONFIG_FILE_NAME):
+        try:
+            data = Path(self._CONFIG_FILE_NAME).read_bytes()
+        except FileNotFoundError:
             for section, values in self.default_configs.items():
                 self.config.add_section(section)
                 for key, value in values.items():
                     self.config.set(section, key, value)
 
             self._save_configs()
+        else:
+            self.config.read_string(data.decode())
 
     def _save_configs(self):
         """
         Writes the current state of the config object to the config file.
+
+        The file is serialized in memory first and written with a single
+        binary `write` call.
         """
-        with open(self._CONFIG_FILE_NAME, 'w') as configfile:
-            self.config.write(configfile)
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        with open(self._CONFIG_FILE_NAME, 'wb') as configfile:
+            configfile.write(buffer.getvalue().encode())
+        self._dirty = False
@@ -1,4 +1,26 @@
+import concurrent.futures
+import contextlib
+import functools
+import queue
 import sqlite3
+import threading
+
+
+def runs_on_worker(method):
+    """
+    Decorator that runs a `DatabaseManager` method on its worker thread.
+
+    The decorated method accepts an extra keyword-only `callback` argument.
+    Without it the call blocks until the worker is done and returns the
+    result (or raises the error) as usual. With it the call returns the
+    pending `concurrent.futures.Future` right away, and `callback(future)`
+    is invoked on the worker thread once the operation finishes.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, callback=None, **kwargs):
+        return self._run(functools.partial(method, self, *args, **kwargs),
+                         callback)
+    return wrapper
 
 
 class DatabaseManager():
@@ -8,14 +30,17 @@ class DatabaseManager():
     This class handles creating the database table, and performing CRUD
     (Create, Read, Update, Delete) operations. It uses the `sqlite3` module
     and provides a layer of abstraction to protect the GUI from direct
-    database calls.
+    database calls. Every operation runs on a `DatabaseWorker` thread that
+    owns the connection, so callers can choose not to block on slow queries.
 
     Attributes:
         path (str): The file path to the SQLite database.
         table (str): The name of the table used for product data.
         columns (tuple): A tuple containing the column names for the table.
-        type_mapping (dict): A mapping from SQLite types to Python types.
+        converters (tuple): The Python type of each column in `columns`,
+            in the same order, used to validate and convert user input.
     """
+    _NUMERIC_TEXT_CHARS = frozenset('0123456789.-+eE%_')
 
     def __init__(self, path):
         """
@@ -25,34 +50,99 @@ class DatabaseManager():
             path (str): The file path for the SQLite database.
         """
         self.table = 'produtos'
-        self.type_mapping = {'INTEGER': int, 'TEXT': str, 'REAL': float}
         self.path = path
         self.columns = ('name', 'quantity', 'price')
+        self.converters = (str, int, float)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False,
+                                     detect_types=0, isolation_level=None,
+                                     cached_statements=256)
+        self._conn.row_factory = None
+        self._conn.executescript(
+            '''PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA busy_timeout=5000;''')
+
+        column_names_str = ', '.join(self.columns)
+        self._sql_insert = (f'INSERT INTO {self.table} ({column_names_str}) '
+                            f'VALUES (?, ?, ?)')
+        self._sql_update = (f'UPDATE {self.table} '
+                            f'SET name = ?, quantity = ?, price = ? '
+                            f'WHERE id = ?')
+        self._sql_select = f'SELECT * FROM {self.table}'
+        self._sql_select_text_ids = (f'SELECT CAST(id AS TEXT), '
+                                     f'{column_names_str} FROM {self.table}')
+        self._sql_count = f'SELECT COUNT(*) FROM {self.table}'
+        self._sql_table_info = f'PRAGMA table_info({self.table})'
+        self._column_types = None
+
+        self._worker = DatabaseWorker()
+        self._worker.start()
+
+    def close(self):
+        """
+        Closes the persistent database connection and stops the worker.
+
+        Should be called once, when the application window is destroyed.
+        """
+        self._run(self._conn.close)
+        self._worker.stop()
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Groups the statements run inside the block into one transaction.
+
+        The transaction is started with `BEGIN IMMEDIATE`, so the write lock
+        is taken up front instead of failing with SQLITE_BUSY halfway
+        through. It is committed when the block exits normally and rolled
+        back if it raises. Since the connection belongs to the worker
+        thread, this must only be used from operations running on it.
+        """
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+
+    @runs_on_worker
     def create_table_if_not_exists(self):
         """
         Creates the 'produtos' table if it does not already exist.
 
+        An index is also created on each sortable column, so that sorting
+        the Treeview can walk the index in order instead of sorting the
+        whole table in memory.
+
         Raises:
             DatabaseError: If an error occurs during the table creation
             process.
         """
         try:
-            with sqlite3.connect(self.path) as connection:
-                cursor = connection.cursor()
+            cursor = self._conn.cursor()
+            cursor.execute(
+                f'''CREATE TABLE IF NOT EXISTS {self.table} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                quantity INTEGER NOT NULL,
+                price REAL NOT NULL)
+                ''')
+            for column in self.columns:
                 cursor.execute(
-                    f'''CREATE TABLE IF NOT EXISTS {self.table} (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    quantity INTEGER NOT NULL,
-                    price REAL NOT NULL)
-                    ''')
+                    f'''CREATE INDEX IF NOT EXISTS idx_{self.table}_{column}
+                    ON {self.table} ({column})''')
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to create table: {e}")
         except Exception as e:
             raise DatabaseError(
                 f'An error occurred in the database operation: {e}')
 
+        self._column_types = self._fetch_column_types()
+
+    @runs_on_worker
     def add_row(self, values):
         """
         Adds a new row of data to the database.
@@ -60,22 +150,49 @@ class DatabaseManager():
         Args:
             values (list): A list of values to be inserted into the table.
 
+        Returns:
+            int: The ID assigned to the new record.
+
         Raises:
             DatabaseError: If the database operation fails.
         """
         try:
-            with sqlite3.connect(self.path) as connection:
-                column_names_str = ', '.join(self.columns)
-                sql_query = f'''INSERT INTO {self.table} ({column_names_str})
-                                 VALUES (?, ?, ?)'''
-                cursor = connection.cursor()
-                cursor.execute(sql_query, values)
+            cursor = self._conn.cursor()
+            cursor.execute(self._sql_insert, values)
+            return cursor.lastrowid
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to add new record: {e}")
         except Exception as e:
             raise DatabaseError(
                 f'An error occurred in the database operation: {e}')
 
+    @runs_on_worker
+    def add_many(self, rows):
+        """
+        Adds several rows of data to the database at once.
+
+        The rows are inserted with `executemany` inside one explicit
+        transaction, so bulk loads pay for a single commit instead of one
+        per record. Prefer this over calling `add_row` in a loop.
+
+        Args:
+            rows (iterable): An iterable of value lists, each one in the same
+            format accepted by `add_row`.
+
+        Raises:
+            DatabaseError: If the database operation fails. No rows are
+            inserted in that case.
+        """
+        try:
+            with self.transaction():
+                self._conn.executemany(self._sql_insert, rows)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to add new records: {e}")
+        except Exception as e:
+            raise DatabaseError(
+                f'An error occurred in the database operation: {e}')
+
+    @runs_on_worker
     def update_row(self, values, record_id):
         """
         Updates an existing row in the database.
@@ -88,47 +205,51 @@ class DatabaseManager():
             DatabaseError: If the database operation fails.
         """
         try:
-            with sqlite3.connect(self.path) as connection:
-                sql_query = f'''UPDATE {self.table}
-                                SET name = ?, quantity = ?, price = ?
-                                WHERE id = ?'''
-                cursor = connection.cursor()
-                params = tuple(values) + (record_id,)
-                cursor.execute(sql_query, params)
+            cursor = self._conn.cursor()
+            params = tuple(values) + (record_id,)
+            cursor.execute(self._sql_update, params)
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to update record: {e}")
         except Exception as e:
             raise DatabaseError(
                 f'An error occurred in the database operation: {e}')
 
+    @runs_on_worker
     def delete_rows(self, ids_to_delete):
         """
         Deletes one or more rows from the database.
 
+        All rows are removed by a single `DELETE ... WHERE id IN (...)`
+        statement inside one explicit transaction, so the whole batch costs
+        one commit no matter how many records are selected.
+
         Args:
-            ids_to_delete (list): A list of integer IDs of the records to
-            delete.
+            ids_to_delete (iterable): The IDs of the records to delete, as
+            integers or numeric strings such as Treeview iids.
 
         Raises:
             DatabaseError: If the database operation fails.
         """
         try:
-            with sqlite3.connect(self.path) as connection:
-                cursor = connection.cursor()
-                placeholders = ', '.join('?' for _ in ids_to_delete)
-                sql_query = f'''DELETE FROM {self.table}
-                                WHERE id IN ({placeholders})'''
-                cursor.execute(sql_query, tuple(ids_to_delete))
+            ids_to_delete = tuple(ids_to_delete)
+            placeholders = ', '.join('?' for _ in ids_to_delete)
+            sql_query = f'''DELETE FROM {self.table}
+                            WHERE id IN ({placeholders})'''
+            with self.transaction():
+                self._conn.execute(sql_query, ids_to_delete)
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to delete records: {e}")
         except Exception as e:
             raise DatabaseError(
                 f'An error occurred in the database operation: {e}')
 
+    @runs_on_worker
     def get_data(self, search_term=None, order_by_column=None,
-                 order_direction='asc'):
+                 order_direction='asc', limit=None, offset=0,
+                 text_ids=False):
         """
-        Retrieves data from the database, with optional filtering and sorting.
+        Retrieves data from the database, with optional filtering, sorting
+        and pagination.
 
         Args:
             search_term (str, optional): A term to search for in all relevant
@@ -140,6 +261,14 @@ class DatabaseManager():
             order_direction (str, optional): The direction of sorting, 'asc' or
             'desc'.
                 Defaults to 'asc'.
+            limit (int, optional): The maximum number of rows to return.
+                Defaults to None, which returns every matching row.
+            offset (int, optional): The number of matching rows to skip
+            before the first returned row. Only used with `limit`.
+                Defaults to 0.
+            text_ids (bool, optional): Whether to return the IDs as strings,
+            ready to be used as Treeview iids.
+                Defaults to False.
 
         Returns:
             list[tuple]: A list of tuples, where each tuple represents a row
@@ -148,37 +277,119 @@ class DatabaseManager():
         Raises:
             DatabaseError: If the database query fails.
         """
-        try:
-            with sqlite3.connect(self.path) as connection:
-                cursor = connection.cursor()
-                query = f"SELECT * FROM {self.table}"
-                params = []
-
-                if search_term and search_term.strip():
-                    search_term = search_term.strip()
-                    where_clause, filter_params = self._build_filter_clause(
-                        search_term)
-                    query += where_clause
-                    params.extend(filter_params)
-
-                if order_by_column and order_by_column in self.columns:
-                    direction = ('ASC' if order_direction.lower() == 'asc'
-                                 else 'DESC')
-                    query += f" ORDER BY {order_by_column} {direction}"
-
-                cursor.execute(query, params)
-                return cursor.fetchall()
-        except sqlite3.Error as e:
-            raise DatabaseError(f"Failed to retrieve data: {e}")
-        except Exception as e:
-            raise DatabaseError(
-                f'An error occurred in the database operation: {e}')
+        return self._select_rows(search_term, order_by_column,
+                                 order_direction, limit, offset, text_ids)
+
+    @runs_on_worker
+    def count_rows(self, search_term=None):
+        """
+        Counts the rows matching a search term.
+
+        Args:
+            search_term (str, optional): A term to search for in all relevant
+            columns, with the same rules as `get_data`.
+                Defaults to None.
+
+        Returns:
+            int: The number of matching rows.
+
+        Raises:
+            DatabaseError: If the database query fails.
+        """
+        return self._count_matching(search_term)
+
+    @runs_on_worker
+    def get_page(self, search_term=None, order_by_column=None,
+                 order_direction='asc', offset=0, limit=200, text_ids=False,
+                 total_rows=None):
+        """
+        Counts the rows matching a search term and retrieves one page of
+        them, in a single call on the worker thread.
+
+        The offset is moved back if needed so the page ends at the last
+        matching row, which keeps the page filled when the result set has
+        shrunk below the requested position.
+
+        Args:
+            search_term (str, optional): A term to search for in all relevant
+            columns, with the same rules as `get_data`.
+                Defaults to None.
+            order_by_column (str, optional): The column name to sort the
+            results by.
+                Defaults to None.
+            order_direction (str, optional): The direction of sorting, 'asc' or
+            'desc'.
+                Defaults to 'asc'.
+            offset (int, optional): The number of matching rows to skip
+            before the first returned row.
+                Defaults to 0.
+            limit (int, optional): The maximum number of rows to return.
+                Defaults to 200.
+            text_ids (bool, optional): Whether to return the IDs as strings,
+            ready to be used as Treeview iids.
+                Defaults to False.
+            total_rows (int, optional): The number of matching rows, if
+            already known, in which case they are not counted again.
+                Defaults to None.
+
+        Returns:
+            tuple: The number of matching rows, the offset actually used and
+            the list of rows of the page.
+
+        Raises:
+            DatabaseError: If the database query fails.
+        """
+        if total_rows is None:
+            total_rows = self._count_matching(search_term)
+        offset = max(0, min(offset, total_rows - limit))
+        rows = self._select_rows(search_term, order_by_column,
+                                 order_direction, limit, offset, text_ids)
+        return total_rows, offset, rows
 
     def get_column_types(self):
         """
         Retrieves the column names and their data types from the database
         table.
 
+        The schema does not change while the application is running, so the
+        result is read from the database once and cached afterwards.
+
+        Returns:
+            dict: A dictionary where keys are column names and values are their
+            SQL data types.
+
+        Raises:
+            DatabaseError: If the database operation fails.
+        """
+        if self._column_types is None:
+            self._column_types = self._run(self._fetch_column_types)
+        return self._column_types
+
+    def _run(self, operation, callback=None):
+        """
+        Hands an operation to the worker thread.
+
+        Args:
+            operation (callable): A function taking no arguments that uses
+                the connection.
+            callback (callable, optional): Called with the finished
+                `Future` on the worker thread. If omitted, this method
+                blocks until the operation is done.
+
+        Returns:
+            The operation's result if no callback was given, otherwise the
+            pending `concurrent.futures.Future`.
+        """
+        future = self._worker.submit(operation)
+        if callback is None:
+            return future.result()
+        future.add_done_callback(callback)
+        return future
+
+    def _fetch_column_types(self):
+        """
+        Reads the column names and their data types from the database table.
+
         Returns:
             dict: A dictionary where keys are column names and values are their
             SQL data types.
@@ -188,27 +399,88 @@ class DatabaseManager():
         """
         column_types = {}
         try:
-            with sqlite3.connect(self.path) as connection:
-                cursor = connection.cursor()
-                cursor.execute(f'PRAGMA table_info({self.table})')
-                for column_info in cursor.fetchall():
-                    column_name = column_info[1]
-                    column_type = column_info[2]
-                    column_types[column_name] = column_type
-                return column_types
+            cursor = self._conn.cursor()
+            cursor.execute(self._sql_table_info)
+            for column_info in cursor.fetchall():
+                column_name = column_info[1]
+                column_type = column_info[2]
+                column_types[column_name] = column_type
+            return column_types
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to retrieve column types: {e}")
         except Exception as e:
             raise DatabaseError(
                 f'An error occurred in the database operation: {e}')
 
+    def _select_rows(self, search_term, order_by_column, order_direction,
+                     limit, offset, text_ids):
+        """
+        Runs the query behind `get_data` on the calling (worker) thread.
+        """
+        try:
+            cursor = self._conn.cursor()
+            query = (self._sql_select_text_ids if text_ids
+                     else self._sql_select)
+            params = []
+
+            if search_term and search_term.strip():
+                search_term = search_term.strip()
+                where_clause, filter_params = self._build_filter_clause(
+                    search_term)
+                query += where_clause
+                params.extend(filter_params)
+
+            if order_by_column and order_by_column in self.columns:
+                direction = ('ASC' if order_direction.lower() == 'asc'
+                             else 'DESC')
+                query += f" ORDER BY {order_by_column} {direction}"
+                if limit is not None:
+                    query += f", id {direction}"
+            elif limit is not None:
+                query += " ORDER BY id"
+
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params.extend((limit, offset))
+
+            return cursor.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to retrieve data: {e}")
+        except Exception as e:
+            raise DatabaseError(
+                f'An error occurred in the database operation: {e}')
+
+    def _count_matching(self, search_term):
+        """
+        Runs the query behind `count_rows` on the calling (worker) thread.
+        """
+        try:
+            cursor = self._conn.cursor()
+            query = self._sql_count
+            params = []
+
+            if search_term and search_term.strip():
+                where_clause, params = self._build_filter_clause(
+                    search_term.strip())
+                query += where_clause
+
+            return cursor.execute(query, params).fetchone()[0]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to count records: {e}")
+        except Exception as e:
+            raise DatabaseError(
+                f'An error occurred in the database operation: {e}')
+
     def _build_filter_clause(self, search_term):
         """
         Builds the SQL WHERE clause and parameters for the search query.
 
         This method handles searching across multiple columns
         (name, quantity, price) and casting numeric values to text for partial
-        matching.
+        matching. The `CAST ... LIKE` conditions defeat any index and force a
+        full scan, so they are only added when the term is made up of
+        characters that can actually appear in a number's text form, or
+        LIKE wildcards that can stand in for them.
 
         Args:
             search_term (str): The term to search for.
@@ -229,15 +501,73 @@ class DatabaseManager():
         except ValueError:
             pass
 
-        conditions.append("CAST(quantity AS TEXT) LIKE ?")
-        params.append(f"%{search_term}%")
-        conditions.append("CAST(price AS TEXT) LIKE ?")
-        params.append(f"%{search_term}%")
+        if set(search_term) <= self._NUMERIC_TEXT_CHARS:
+            conditions.append("CAST(quantity AS TEXT) LIKE ?")
+            params.append(f"%{search_term}%")
+            conditions.append("CAST(price AS TEXT) LIKE ?")
+            params.append(f"%{search_term}%")
 
         where_clause = " WHERE " + " OR ".join(conditions)
         return where_clause, params
 
 
+class DatabaseWorker(threading.Thread):
+    """
+    A background thread that runs database operations one at a time.
+
+    SQLite serializes access to a connection anyway, so a single thread
+    that owns the connection and works through a queue of operations keeps
+    slow queries off the Tk event loop without any extra locking.
+    """
+
+    def __init__(self):
+        """
+        Initializes the worker with an empty task queue.
+        """
+        super().__init__(name='DatabaseWorker', daemon=True)
+        self._tasks = queue.Queue()
+
+    def submit(self, operation):
+        """
+        Queues an operation to be run on the worker thread.
+
+        Args:
+            operation (callable): A function taking no arguments.
+
+        Returns:
+            concurrent.futures.Future: A future holding the operation's
+            result or the exception it raised.
+        """
+        future = concurrent.futures.Future()
+        self._tasks.put((operation, future))
+        return future
+
+    def stop(self):
+        """
+        Finishes the queued operations and then stops the thread.
+        """
+        self._tasks.put(None)
+        self.join()
+
+    def run(self):
+        """
+        Runs queued operations in order until `stop` is called.
+        """
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+            operation, future = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = operation()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
 class DatabaseError(Exception):
     """
     Custom exception to handle database-related errors.
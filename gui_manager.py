@@ -1,11 +1,27 @@
+import functools
+import queue
 import tkinter as tk
 import ttkbootstrap as ttk
-import openpyxl
 from ttkbootstrap import Style
 from database_manager import DatabaseError
 from tkinter import messagebox, filedialog
 
 
+def reports_errors(method):
+    """
+    Decorator for `MainWindow` event handlers that reports any exception
+    they raise in the InfoDisplay through `_handle_exception`, instead of
+    each handler repeating the same try/except block.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            self._handle_exception(e)
+    return wrapper
+
+
 class MainWindow(tk.Tk):
     """
     The main application window for the inventory management system.
@@ -19,6 +35,13 @@ class MainWindow(tk.Tk):
         "sandstone", "united", "yeti", "morph", "simplex", "cerculean",
         "solar", "superhero", "darkly", "cyborg", "vapor"
         ]
+    _DB_POLL_MS = 20
+    _CONFIG_FLUSH_MS = 1000
+    _SEARCH_DELAY_MS = 300
+    _FILL_DELAY_MS = 30
+    _QUERY_CACHE_SIZE = 64
+    _LOADING_DELAY_MS = 200
+    _LOADING_TEXT = 'Loading…'
 
     def __init__(self, title, db_manager, config_manager):
         """
@@ -26,7 +49,8 @@ class MainWindow(tk.Tk):
 
         This method sets up the window's title and calls helper methods to
         create all GUI components, including frames, buttons, entry widgets,
-        and the Treeview.
+        and the Treeview. The window stays hidden while they are built, so
+        it is first shown with the complete layout and the saved theme.
 
         Args:
             title (str): The title to be displayed on the application window.
@@ -38,7 +62,28 @@ class MainWindow(tk.Tk):
         super().__init__()
         self.db_manager = db_manager
         self.config_manager = config_manager
-        self.style = Style(theme=self.available_themes[0])
+        self._page_query = ('', None, 'asc')
+        column_types = db_manager.get_column_types()
+        self._export_headers = list(column_types)
+        self._validators = tuple(
+            (name, converter, column_types[name].lower())
+            for name, converter in zip(db_manager.columns,
+                                       db_manager.converters))
+        self._db_results = queue.Queue()
+        self._db_pending = 0
+        self._poll_job = None
+        self._config_flush_job = None
+        self._search_job = None
+        self._fill_job = None
+        self._last_search_term = ''
+        self._refresh_pending = False
+        self._page_cache = {}
+        self._row_counts = {}
+        self._data_version = 0
+        self._load_generation = 0
+        self._loading_job = None
+        self.withdraw()
+        self.style = Style(theme=self.config_manager.get_theme())
         self.title(title)
         self._create_frames()
         self.info_display = InfoDisplay(self.left_frame)
@@ -47,135 +92,138 @@ class MainWindow(tk.Tk):
         self._create_entrys()
         self._create_search_box()
         self._setup_treeview()
+        self.deiconify()
 
+    @reports_errors
     def request_sorted_data(self, column, direction):
         """
         Requests sorted data from the database and updates the Treeview.
 
         This method is called by the Treeview's sorting functionality. It
-        fetches data using the current search term and the provided sort
-        parameters, then refreshes the Treeview with the new data.
+        reloads the Treeview using the current search term and the provided
+        sort parameters.
 
         Args:
             column (str): The column name to sort the data by.
             direction (str): The sort direction, either 'asc' or 'desc'.
         """
         self.info_display.clear_text()
-        try:
-            current_search_term = self.user_entry.get() if hasattr(
-                self, 'user_entry') else None
-
-            data = self.db_manager.get_data(
-                search_term=current_search_term,
-                order_by_column=column,
-                order_direction=direction
-            )
-            self.treeview.update(data)
-        except Exception as e:
-            self._handle_exception(e)
+        current_search_term = self.user_entry.get()
+
+        self._load_treeview(current_search_term, column, direction)
+
+    def request_rows(self, offset, limit, handler):
+        """
+        Fetches rows of the result set currently shown in the Treeview.
 
+        This is called by the Treeview whenever it needs rows that are not
+        in its buffered page, e.g. while scrolling. A page fetched before is
+        handed over at once; otherwise it is fetched on the database worker
+        and handed over by `_on_rows_fetched`, so the Treeview never waits
+        for the database. Errors are reported in the InfoDisplay and the
+        handler is not called.
+
+        Args:
+            offset (int): The index of the first row to fetch.
+            limit (int): The maximum number of rows to fetch.
+            handler (callable): Called on the Tk thread as `handler(rows)`,
+                with the rows as a tuple and their IDs as strings.
+        """
+        key = (*self._page_query, offset, limit)
+        rows = self._page_cache.get(key)
+        if rows is not None:
+            handler(rows)
+            return
+        self.db_manager.get_data(
+            *self._page_query, limit=limit, offset=offset, text_ids=True,
+            callback=self._on_db_done(
+                self._on_rows_fetched, self._load_generation,
+                self._data_version, key, handler))
+
+    @reports_errors
     def add_row(self):
         """
         Handles adding a new row to the database.
 
-        It validates the entry fields, calls the database manager to insert
-        the data, updates the GUI with a success message, and refreshes the
-        Treeview.
+        It validates the entry fields and asks the database manager to
+        insert the data in the background. The GUI is updated by
+        `_on_row_added` once the insert is done.
         """
-        columns = self.db_manager.get_column_types()
-        values = [entry_box.get() for entry_box in self.entry_box_list]
-        try:
-            self._validate_entrys(values, columns)
-            self.db_manager.add_row(values)
-            self.info_display.update_text('Entry added successfully',
-                                          foreground='green', duration_ms=3000)
-            self._refresh_treeview()
-            self._clear_entry_boxes()
-
-        except Exception as e:
-            self._handle_exception(e)
+        values = [get() for get in self._entry_getters]
+        values = self._validate_entrys(values)
+        self._bump_data_version()
+        self.db_manager.add_row(
+            values, callback=self._on_db_done(self._on_row_added, values))
 
+    @reports_errors
     def update_row(self):
         """
         Handles updating a selected row in the database.
 
-        It checks for a selected row, validates the entry fields, and calls
-        the database manager to update the record. It then refreshes the
-        Treeview and clears the entry boxes.
+        It checks for a selected row, validates the entry fields, and asks
+        the database manager to update the record in the background. The
+        GUI is updated by `_on_row_updated` once the update is done.
         """
-        columns = self.db_manager.get_column_types()
-        values = [entry_box.get() for entry_box in self.entry_box_list]
-        try:
-            selected_row_iid = self.treeview.selection()
-            if not selected_row_iid:
-                raise GUIValidationError('Select one row to update!')
-
-            self._validate_entrys(values, columns)
-            self.db_manager.update_row(values, selected_row_iid[0])
-            self.info_display.update_text('Entry updated successfully',
-                                          foreground='green', duration_ms=3000)
-            self._refresh_treeview()
-            self._clear_entry_boxes()
+        values = [get() for get in self._entry_getters]
+        selection = self.treeview.selected_iids()
+        if not selection:
+            raise GUIValidationError('Select one row to update!')
 
-        except Exception as e:
-            self._handle_exception(e)
+        selected_row_iid = selection[0]
+        values = self._validate_entrys(values)
+        self._bump_data_version()
+        self.db_manager.update_row(
+            values, selected_row_iid,
+            callback=self._on_db_done(
+                self._on_row_updated, selected_row_iid, values))
 
+    @reports_errors
     def delete_rows(self):
         """
         Handles deleting one or more selected rows from the database.
 
         It first prompts the user for confirmation and then deletes the
-        selected records. The Treeview is refreshed upon successful deletion.
+        selected records in the background. The deleted rows are removed
+        from the Treeview by `_on_rows_deleted` upon successful deletion.
         """
-        try:
-            selected_rows_iids = self.treeview.selection()
-            if not selected_rows_iids:
-                raise GUIValidationError('Select one or more rows to delete!')
-
-            response = messagebox.askyesno(
-                'Confirmation',
-                'Are you sure you want to delete the selected entries?')
+        selected_rows_iids = self.treeview.selected_iids()
+        if not selected_rows_iids:
+            raise GUIValidationError('Select one or more rows to delete!')
 
-            if not response:
-                return
+        response = messagebox.askyesno(
+            'Confirmation',
+            'Are you sure you want to delete the selected entries?')
 
-            ids_to_delete = [int(iid) for iid in selected_rows_iids]
-            self.db_manager.delete_rows(ids_to_delete)
-            self.info_display.update_text(
-                'Entry(s) deleted successfully', foreground='green',
-                duration_ms=3000)
-            self._refresh_treeview()
+        if not response:
+            return
 
-        except Exception as e:
-            self._handle_exception(e)
+        self._bump_data_version()
+        self.db_manager.delete_rows(
+            selected_rows_iids, callback=self._on_db_done(
+                self._on_rows_deleted, selected_rows_iids))
 
+    @reports_errors
     def export_data(self):
         """
         Exports the currently displayed data to an Excel file (.xlsx).
         Orchestrates the entire export process, including getting the file
         path, fetching data, and writing to the Excel file.
         """
-        try:
-            file_path = self._get_export_path()
-            if not file_path:
-                return
+        file_path = self._get_export_path()
+        if not file_path:
+            return
 
-            data = self.db_manager.get_data(
-                search_term=self.user_entry.get(),
-                order_by_column=self.treeview.current_sort_column,
-                order_direction=self.treeview.sort_direction
-            )
-
-            headers = list(self.db_manager.get_column_types().keys())
-
-            self._write_data_to_excel(file_path, headers, data)
-            self.info_display.update_text(
-                f'Data exported successfully to {file_path}',
-                foreground='green', duration_ms=5000
-            )
+        data = self.db_manager.get_data(
+            search_term=self.user_entry.get(),
+            order_by_column=self.treeview.current_sort_column,
+            order_direction=self.treeview.sort_direction
+        )
 
-        except Exception as e:
-            self._handle_exception(e)
+        self._write_data_to_excel(file_path, self._export_headers, data)
+        self.info_display.update_text(
+            f'Data exported successfully to {file_path}',
+            foreground='green', duration_ms=5000
+        )
 
     def _get_export_path(self):
         """Prompts the user for a save location for the Excel file."""
@@ -185,7 +233,14 @@ class MainWindow(tk.Tk):
         )
 
     def _write_data_to_excel(self, file_path, headers, data):
-        """Writes the provided headers and data to a new Excel file."""
+        """
+        Writes the provided headers and data to a new Excel file.
+
+        openpyxl is imported here rather than at module level, so its import
+        time is only paid by users who actually export.
+        """
+        import openpyxl
+
         workbook = openpyxl.Workbook()
         sheet = workbook.active
         sheet.title = "Inventory Data"
@@ -202,11 +257,17 @@ class MainWindow(tk.Tk):
     def _create_frames(self):
         """
         Creates the main frames for the application layout.
+
+        Both sides share a single `ttk.Panedwindow`, which also lets the
+        user resize them with the divider. Only the right side grows with
+        the window.
         """
-        self.frame = Frame(self, side='top')
-        self.right_frame = Frame(self.frame, side='right')
-        self.left_frame = Frame(
-            self.frame, side='left', anchor='n', expand=False)
+        self.paned = ttk.Panedwindow(self, orient='horizontal')
+        self.paned.pack(fill='both', expand=True, padx=10, pady=10)
+        self.left_frame = ttk.Frame(self.paned)
+        self.right_frame = ttk.Frame(self.paned)
+        self.paned.add(self.left_frame, weight=0)
+        self.paned.add(self.right_frame, weight=1)
 
     def _create_buttons(self):
         """
@@ -224,8 +285,8 @@ class MainWindow(tk.Tk):
         Creates a Combobox widget for selecting application themes.
 
         The widget's initial selection is set from the saved configuration,
-        and its selection event is bound to a method that changes and saves
-        the theme.
+        which the style was already created with, and its selection event is
+        bound to a method that changes and saves the theme.
         """
         self.selected_theme = tk.StringVar(
             value=self.config_manager.get_theme())
@@ -234,19 +295,30 @@ class MainWindow(tk.Tk):
             textvariable=self.selected_theme)
         self.combobox.bind("<<ComboboxSelected>>", self._update_theme)
         self.combobox.pack(side='right')
-        self._update_theme()
 
     def _update_theme(self, event=None):
         """
         Applies a new theme and saves the selection to the configuration file.
 
-        This method is called both by the Combobox selection event and manually
-        during initialization to ensure the correct theme is loaded.
+        This method is called by the Combobox selection event. The file
+        is written once the selection has been stable for a second, so
+        browsing through themes does not rewrite it on every change.
         """
         theme = self.selected_theme.get()
         self.style.theme_use(theme)
         if theme != self.config_manager.get_theme():
             self.config_manager.set_theme(theme)
+            if self._config_flush_job:
+                self.after_cancel(self._config_flush_job)
+            self._config_flush_job = self.after(self._CONFIG_FLUSH_MS,
+                                                self._flush_config)
+
+    def _flush_config(self):
+        """
+        Writes pending configuration changes to disk.
+        """
+        self._config_flush_job = None
+        self.config_manager.flush()
 
     def _create_entrys(self):
         """
@@ -256,6 +328,8 @@ class MainWindow(tk.Tk):
         self.entry_box_list = [Entry(entrys_frame, 'Name'),
                                Entry(entrys_frame, 'Quantity'),
                                Entry(entrys_frame, 'Price')]
+        self._entry_getters = [entry.var.get for entry in self.entry_box_list]
+        self._entry_setters = [entry.var.set for entry in self.entry_box_list]
 
     def _create_search_box(self):
         """
@@ -274,16 +348,18 @@ class MainWindow(tk.Tk):
         """
         self.treeview = Treeview(
             self.right_frame, self.db_manager.columns, self)
-        self.treeview.bind('<ButtonRelease-1>', self._fill_entrys)
+        self.treeview.bind('<ButtonRelease-1>', self._schedule_fill)
         try:
-            self.treeview.update(self.db_manager.get_data())
+            offset, limit = self.treeview.page_bounds()
+            self._show_result(('', None, 'asc'), *self.db_manager.get_page(
+                offset=offset, limit=limit, text_ids=True))
         except DatabaseError as e:
             self.info_display.update_text(
                 f"Error loading initial data: {e}", foreground='red')
         except Exception as e:
             self.info_display.update_text(
-                f'''An unexpected error occurred during initial data loading:
-                    {e}''', foreground='red')
+                f"Unexpected error during initial load: {e}",
+                foreground='red')
 
     def _refresh_treeview(self):
         """
@@ -294,93 +370,414 @@ class MainWindow(tk.Tk):
         order_by_column = self.treeview.current_sort_column
         order_direction = self.treeview.sort_direction
 
-        data = self.db_manager.get_data(
-            search_term=current_search_term,
-            order_by_column=order_by_column,
-            order_direction=order_direction
-        )
-        self.treeview.update(data)
+        self._load_treeview(current_search_term, order_by_column,
+                            order_direction)
+
+    def _load_treeview(self, search_term, order_by_column, order_direction):
+        """
+        Points the Treeview at a new result set.
+
+        The matching rows are counted and the page the Treeview needs
+        first is fetched in one call on the database worker, so the UI
+        stays responsive however long the scan takes. A count already known
+        for the search term is reused. Each call starts a new generation,
+        and results belonging to an older one are dropped when they arrive,
+        so a slow query never overwrites the result of a newer one, while
+        results of a query that ran before a change to the data was
+        submitted are fetched again. A loading message is shown if the
+        query takes longer than `_LOADING_DELAY_MS`.
+
+        Args:
+            search_term (str): The term to filter rows by.
+            order_by_column (str): The column name to sort the data by.
+            order_direction (str): The sort direction, either 'asc' or 'desc'.
+        """
+        self._load_generation += 1
+        query = (search_term, order_by_column, order_direction)
+        if self._loading_job is None:
+            self._loading_job = self.after(self._LOADING_DELAY_MS,
+                                           self._show_loading)
+        offset, limit = self.treeview.page_bounds()
+        self.db_manager.get_page(
+            search_term, order_by_column, order_direction, offset, limit,
+            text_ids=True, total_rows=self._row_counts.get(search_term),
+            callback=self._on_db_done(
+                self._on_page_loaded, self._load_generation,
+                self._data_version, query))
+
+    def _show_loading(self):
+        """
+        Shows the loading message for a query that is still running.
+        """
+        self._loading_job = None
+        self.info_display.update_text(self._LOADING_TEXT, foreground='gray')
+
+    def _hide_loading(self):
+        """
+        Cancels or clears the loading message, leaving any other message
+        shown in the meantime untouched.
+        """
+        if self._loading_job is not None:
+            self.after_cancel(self._loading_job)
+            self._loading_job = None
+        elif self.info_display.shows(self._LOADING_TEXT):
+            self.info_display.clear_text()
+
+    def _on_page_loaded(self, future, generation, version, query):
+        """
+        Shows the result set once its first page has arrived, unless a newer
+        one was requested in the meantime. A result set read before the data
+        was last changed is requested again instead.
+        """
+        if generation != self._load_generation:
+            return
+        if version != self._data_version:
+            self._load_treeview(*query)
+            return
+        self._hide_loading()
+        try:
+            total_rows, offset, rows = future.result()
+        except Exception as e:
+            self._handle_exception(e)
+            return
+        if len(self._row_counts) >= self._QUERY_CACHE_SIZE:
+            self._row_counts.clear()
+        self._row_counts[query[0]] = total_rows
+        self._show_result(query, total_rows, offset, rows)
+
+    def _show_result(self, query, total_rows, offset, rows):
+        """
+        Loads a result set into the Treeview, starting with an already
+        fetched page. Further pages are requested through `request_rows` as
+        the user scrolls.
+
+        Args:
+            query (tuple): The search term, sort column and sort direction.
+            total_rows (int): The number of rows in the result set.
+            offset (int): The index of the first row of `rows`.
+            rows (list[tuple]): The first page of the result set.
+        """
+        self._page_query = query
+        self.treeview.load(total_rows, offset, rows)
+
+    @reports_errors
+    def _on_rows_fetched(self, future, generation, version, key, handler):
+        """
+        Hands rows fetched by `request_rows` to the Treeview and caches them.
+
+        Rows of a result set that is no longer shown are dropped, and rows
+        read before the data was last changed are requested again.
+        """
+        if generation != self._load_generation:
+            return
+        if version != self._data_version:
+            self.request_rows(*key[3:], handler)
+            return
+        rows = tuple(future.result())
+        if len(self._page_cache) >= self._QUERY_CACHE_SIZE:
+            self._page_cache.clear()
+        self._page_cache[key] = rows
+        handler(rows)
+
+    def _bump_data_version(self):
+        """
+        Marks the data as changed, right before a change is submitted to the
+        database worker.
+
+        Cached pages and row counts are dropped here rather than once the
+        change is done, so a query submitted in between cannot reuse them,
+        and results of queries submitted earlier are recognised as stale by
+        their version when they arrive.
+        """
+        self._data_version += 1
+        self._page_cache.clear()
+        self._row_counts.clear()
+
+    def _schedule_refresh(self):
+        """
+        Schedules a Treeview refresh for when the event loop is idle.
+
+        Several mutations finishing within the same event-loop turn share a
+        single refresh instead of each reloading the Treeview.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._do_refresh)
+
+    @reports_errors
+    def _do_refresh(self):
+        """
+        Runs the refresh scheduled by `_schedule_refresh`.
+        """
+        self._refresh_pending = False
+        self._refresh_treeview()
+
+    def _can_patch_treeview(self):
+        """
+        Checks whether a single-row change can be applied to the Treeview
+        in place instead of reloading it from the database.
+
+        This is only safe when the result set on screen has no search filter
+        or sort order, since the Treeview then shows every row in insertion
+        order. The query the result set on screen was loaded with is
+        checked, rather than the search box and the sort column, which do
+        not always match it.
+
+        Returns:
+            bool: True if the Treeview can be updated incrementally.
+        """
+        return self._page_query[:2] == ('', None)
+
+    def _on_db_done(self, handler, *args):
+        """
+        Builds a callback for a background database call.
+
+        The callback runs on the database worker thread, where Tk must not
+        be touched, so it only queues the finished future. The handler is
+        then called on the Tk thread by `_poll_db_results`, which only
+        polls while such calls are outstanding.
+
+        Args:
+            handler (callable): Called as `handler(future, *args)`.
+            *args: Extra arguments passed to the handler.
+
+        Returns:
+            callable: A callback suitable for the `callback` argument of
+            the `DatabaseManager` methods.
+        """
+        self._db_pending += 1
+        if self._poll_job is None:
+            self._poll_job = self.after(self._DB_POLL_MS,
+                                        self._poll_db_results)
+        return lambda future: self._db_results.put((handler, future, args))
+
+    def _poll_db_results(self):
+        """
+        Runs the handlers of finished background database calls and
+        schedules the next poll while any are still outstanding.
+
+        A handler raising is reported like any other error and does not
+        stop the results of later calls from being handled.
+        """
+        self._poll_job = None
+        try:
+            while True:
+                try:
+                    handler, future, args = self._db_results.get_nowait()
+                except queue.Empty:
+                    break
+                self._db_pending -= 1
+                try:
+                    handler(future, *args)
+                except Exception as e:
+                    self._handle_exception(e)
+        finally:
+            if self._db_pending and self._poll_job is None:
+                self._poll_job = self.after(self._DB_POLL_MS,
+                                            self._poll_db_results)
+
+    @reports_errors
+    def _on_row_added(self, future, values):
+        """
+        Updates the GUI after a background insert has finished.
+
+        Args:
+            future (concurrent.futures.Future): The finished insert, holding
+                the new record ID.
+            values (list): The values that were inserted.
+        """
+        record_id = future.result()
+        self.info_display.update_text('Entry added successfully',
+                                      foreground='green', duration_ms=3000)
+        if self._can_patch_treeview():
+            self.treeview.append_row((record_id, *values))
+        else:
+            self._schedule_refresh()
+        self._clear_entry_boxes()
+
+    @reports_errors
+    def _on_row_updated(self, future, record_iid, values):
+        """
+        Updates the GUI after a background update has finished.
+
+        Args:
+            future (concurrent.futures.Future): The finished update.
+            record_iid (str): The Treeview iid of the updated record.
+            values (list): The new values of the record.
+        """
+        future.result()
+        self.info_display.update_text('Entry updated successfully',
+                                      foreground='green', duration_ms=3000)
+        if self._can_patch_treeview():
+            self.treeview.replace_row((record_iid, *values))
+        else:
+            self._schedule_refresh()
+        self._clear_entry_boxes()
 
-    def _fill_entrys(self, event):
+    @reports_errors
+    def _on_rows_deleted(self, future, iids):
+        """
+        Updates the GUI after a background delete has finished.
+
+        Args:
+            future (concurrent.futures.Future): The finished delete.
+            iids (tuple): The Treeview iids of the deleted records.
+        """
+        future.result()
+        self.info_display.update_text(
+            'Entry(s) deleted successfully', foreground='green',
+            duration_ms=3000)
+        if not self.treeview.remove_rows(iids):
+            self._schedule_refresh()
+
+    def _schedule_fill(self, event):
+        """
+        Handles clicks on the Treeview by scheduling `_fill_entrys`.
+
+        Like the search, this is debounced: a burst of clicks only fills
+        the entry boxes once, for the final selection.
+        """
+        if self._fill_job:
+            self.after_cancel(self._fill_job)
+        self._fill_job = self.after(self._FILL_DELAY_MS, self._fill_entrys)
+
+    def _fill_entrys(self):
         """
         Populates the entry boxes with data from the selected row in the
-        Treeview.
+        Treeview, or clears them if no row is selected.
+
+        Each entry box is filled by setting its variable, which replaces
+        the old text in one step.
         """
+        self._fill_job = None
         self.info_display.clear_text()
-        self._clear_entry_boxes()
-        if self.treeview.selection():
-            selected_row_iid = self.treeview.selection()[0]
-            data = self.treeview.item(selected_row_iid, 'values')
-            for n in range(len(data)):
-                self.entry_box_list[n].insert(0, data[n])
+        selection = self.treeview.selected_iids()
+        data = selection and self.treeview.row_values(selection[0])
+        if not data:
+            self._clear_entry_boxes()
+            return
+        for set_value, value in zip(self._entry_setters, data):
+            set_value(value)
 
-    def _validate_entrys(self, values, columns):
+    def _validate_entrys(self, values):
         """
         Validates the user input in the entry boxes against the database
-        schema.
+        schema and converts it to the column types.
+
+        Each value is converted exactly once, with the `(column, converter,
+        type name)` triples prepared in `__init__`; the conversion itself is
+        the validation, so no separate trial parse is needed.
 
         Args:
             values (list): The list of values from the entry boxes.
-            columns (dict): A dictionary of column names and their data types.
+
+        Returns:
+            list: The values converted to the types stored in the database.
 
         Raises:
             GUIValidationError: If validation fails (e.g., empty fields,
                 incorrect data types).
         """
-        column_names = [name for name in columns if name != 'id']
+        converted = []
         errors = []
-        for i, col_name in enumerate(column_names):
-            value = values[i].strip()
+        for (col_name, converter, type_name), value in zip(
+                self._validators, values):
+            value = value.strip()
             if not value:
                 errors.append(f'"{col_name}" cannot be empty.')
                 continue
 
-            expected_db_type = columns.get(col_name)
-            if expected_db_type:
-                type_converter = self.db_manager.type_mapping.get(
-                    expected_db_type)
-                try:
-                    type_converter(value)
-                except ValueError:
-                    errors.append(f'"{col_name}" must be a valid '
-                                  f'{expected_db_type.lower()} number.')
-            else:
-                errors.append(f'Internal Error: Column "{col_name}" type not '
-                              f'found.')
+            try:
+                converted.append(converter(value))
+            except ValueError:
+                errors.append(f'"{col_name}" must be a valid '
+                              f'{type_name} number.')
         if errors:
             raise GUIValidationError('\n'.join(errors))
+        return converted
 
     def _on_string_var_change(self, *args):
         """
         Handles the 'write' event on the search box to trigger live filtering.
+
+        The search is debounced: each keystroke cancels the pending search
+        and schedules a new one, so only the last keystroke of a burst
+        queries the database.
+        """
+        if self._search_job:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self._SEARCH_DELAY_MS, self._do_search)
+
+    def _do_search(self):
+        """
+        Runs the debounced search once Tk is idle.
+
+        Deferring the query to `after_idle` lets pending keystrokes and
+        redraws be handled first, so the search box keeps echoing input
+        even if the query takes a while.
         """
+        self._search_job = self.after_idle(self._run_search)
+
+    @reports_errors
+    def _run_search(self):
+        """
+        Filters the Treeview with the current content of the search box.
+
+        Nothing is queried if the text is the same as in the last search,
+        e.g. when a character is typed and deleted again within the
+        debounce delay.
+        """
+        self._search_job = None
         current_text = self.user_entry.get()
-        data = self.db_manager.get_data(current_text)
-        self.treeview.update(data)
+        if current_text == self._last_search_term:
+            return
+        self._load_treeview(current_text, None, 'asc')
+        self._last_search_term = current_text
 
     def _clear_entry_boxes(self):
         """
         Clears the content of all entry boxes.
         """
-        for entry in self.entry_box_list:
-            entry.delete(0, 'end')
+        for set_value in self._entry_setters:
+            set_value('')
 
     def _handle_exception(self, error):
         """
         Centralizes the handling of exceptions, displaying a user-friendly
         error message in the InfoDisplay.
 
+        The message format is looked up in `_ERROR_FORMATS` by the
+        exception's class, walking its MRO so subclasses share the format
+        of their closest listed base class.
+
         Args:
             error (Exception): The exception object to be handled.
         """
-        if isinstance(error, GUIValidationError):
-            message = f"Input Error: {error}"
-        elif isinstance(error, DatabaseError):
-            message = f"Database Error: {error}"
-        else:
-            message = f"An unexpected error occurred: {error}"
+        message_format = _DEFAULT_ERROR_FORMAT
+        for error_class in type(error).__mro__:
+            if error_class in _ERROR_FORMATS:
+                message_format = _ERROR_FORMATS[error_class]
+                break
 
-        self.info_display.update_text(message, foreground='red')
+        self.info_display.update_text(message_format.format(error),
+                                      foreground='red')
+
+
+_TCL_ESCAPES = str.maketrans(
+    {**{char: '\\' + char for char in '\\{}[]$"; '},
+     '\t': '\\t', '\n': '\\n', '\r': '\\r', '\v': '\\v', '\f': '\\f',
+     '\0': '\\x00'})
+
+
+def _tcl_quote(value):
+    """
+    Formats a value as a single word of a Tcl script.
+
+    Every character Tcl treats specially is backslash-escaped, so free
+    text such as product names is passed through literally.
+    """
+    text = str(value)
+    return text.translate(_TCL_ESCAPES) if text else '{}'
 
 
 class Treeview(ttk.Treeview):
@@ -390,7 +787,23 @@ class Treeview(ttk.Treeview):
     This class configures the columns, handles sorting, and provides methods
     for updating the displayed data. It also manages scrollbars and binds
     events for user interaction.
+
+    The Treeview is virtualized and paginated: only the rows that fit in
+    the viewport, measured again whenever the widget is resized, are
+    inserted as Tk items, and only a page of rows around them is held in
+    memory. The first page of a result set is passed to `load`, and further
+    pages are requested from the main window with `request_rows` when
+    scrolling leaves the buffered page, so both the number of Tk items and
+    the memory used stay constant regardless of the table size.
+
+    Since rows scrolled out of the window are deleted as Tk items, the
+    selection and the focus row are kept here rather than in Tk: clicks
+    and the navigation keys are handled by this class, and the selection
+    is re-applied to rows as they are rendered again.
     """
+    _VISIBLE_ROWS = 30
+    _PAGE_SIZE = 200
+    _WHEEL_STEP = 3
 
     def __init__(self, master, columns, main_window):
         """
@@ -406,16 +819,37 @@ class Treeview(ttk.Treeview):
         self.frame = Frame(master, text='Summary', side='right')
         super().__init__(self.frame)
         x_scroll = self.create_xscroll()
-        y_scroll = self.create_yscroll()
+        self.y_scroll = self.create_yscroll()
 
         self.columns = columns
-        self.configure(yscrollcommand=y_scroll.set, columns=self.columns,
-                       xscrollcommand=x_scroll.set, height=30)
+        self.configure(columns=self.columns, xscrollcommand=x_scroll.set,
+                       height=self._VISIBLE_ROWS)
         self.configure_columns()
         self.pack(fill='both', expand=True)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.bind(sequence, self._on_mousewheel)
+        self.bind('<Configure>', self._on_configure)
+        self.bind('<Button-1>', self._on_click)
+        self.bind('<Shift-Button-1>', self._on_shift_click)
+        self.bind('<<ToggleSelection>>', self._on_toggle_click)
+        for key in ('Up', 'Down', 'Prior', 'Next', 'Home', 'End'):
+            self.bind(f'<{key}>', self._on_navigate)
 
         self.current_sort_column = None
         self.sort_direction = 'asc'
+        self._total_rows = 0
+        self._data_rows = None
+        self._buffer_start = 0
+        self._top_index = 0
+        self._visible_rows = self._VISIBLE_ROWS
+        self._fit_pending = False
+        self._page_request = None
+        self._selected = set()
+        self._focus_index = None
+        self._focus_pending = False
+        self._range_request = None
+        self._rendered_rows = {}
+        self._rendered_top = 0
 
     def configure_columns(self):
         """
@@ -460,23 +894,429 @@ class Treeview(ttk.Treeview):
     def create_yscroll(self):
         """
         Creates and returns a vertical scrollbar for the Treeview.
+
+        The scrollbar drives `yview`, which scrolls the virtual window over
+        the whole data set rather than the items currently in the widget.
         """
         treescroll = ttk.Scrollbar(self.frame, orient='vertical')
         treescroll.config(command=self.yview)
         treescroll.pack(side='right', fill='y')
         return treescroll
 
-    def update(self, data):
+    def load(self, total_rows, offset, rows):
         """
-        Clears the existing data and inserts new data into the Treeview.
+        Shows a new result set, starting with one already fetched page.
 
         Args:
-            data (list): A list of tuples, where each tuple represents a
-                row of data to be inserted.
+            total_rows (int): The number of rows in the new result set.
+            offset (int): The index of the first row of `rows`.
+            rows (list[tuple]): A page of the result set, normally the one
+                described by `page_bounds`, with IDs as strings.
+        """
+        self._total_rows = total_rows
+        self._buffer_start = offset
+        self._data_rows = [(row[0], row[1:]) for row in rows]
+        self._page_request = None
+        self._focus_index = None
+        self._set_selection(())
+        self._render()
+
+    def selected_iids(self):
         """
-        self.delete(*self.get_children())
-        for row in data:
-            self.insert('', 'end', iid=row[0], values=row[1:])
+        Returns the iids of the selected rows, including those scrolled out
+        of view. Rows in the buffered page come first, in display order.
+
+        Returns:
+            tuple: The selected iids.
+        """
+        buffered = [iid for iid, _ in self._data_rows or ()
+                    if iid in self._selected]
+        return (*buffered, *self._selected.difference(buffered))
+
+    def row_values(self, iid):
+        """
+        Returns the values of a row in the buffered page, or None if the row
+        is not buffered.
+
+        Args:
+            iid (str): The iid of the row.
+        """
+        for current_iid, values in self._data_rows or ():
+            if current_iid == iid:
+                return values
+        return None
+
+    def page_bounds(self):
+        """
+        Returns the `(offset, limit)` of the page needed to show the rows
+        at the current scroll position.
+        """
+        start = self._top_index // self._visible_rows * self._visible_rows
+        return start, max(self._PAGE_SIZE, 2 * self._visible_rows)
+
+    def append_row(self, row):
+        """
+        Adds a single row after the existing data.
+
+        Args:
+            row (tuple): The new row, starting with its ID.
+        """
+        if (self._data_rows is not None and
+                self._buffer_start + len(self._data_rows)
+                == self._total_rows):
+            self._data_rows.append((str(row[0]), row[1:]))
+        self._total_rows += 1
+        self._render()
+
+    def replace_row(self, row):
+        """
+        Replaces the values of an existing row, keeping its position.
+
+        Args:
+            row (tuple): The updated row, starting with its ID.
+        """
+        iid = str(row[0])
+        for index, (current_iid, _) in enumerate(self._data_rows or ()):
+            if current_iid == iid:
+                self._data_rows[index] = (iid, row[1:])
+                break
+        self._render()
+
+    def remove_rows(self, iids):
+        """
+        Removes the rows with the given IDs.
+
+        This is only possible if every row is in the buffered page, since
+        the position of any other row is unknown.
+
+        Args:
+            iids (iterable): The Treeview iids of the rows to remove.
+
+        Returns:
+            bool: False if some of the rows are not buffered, in which case
+            nothing is changed and the result set has to be reloaded.
+        """
+        iids = set(iids)
+        rows = self._data_rows or []
+        kept = [row for row in rows if row[0] not in iids]
+        if len(rows) - len(kept) != len(iids):
+            return False
+        if self._focus_index is not None:
+            focus = self._focus_index - self._buffer_start
+            if 0 <= focus < len(rows) and rows[focus][0] in iids:
+                self._focus_index = None
+                self._focus_pending = False
+            else:
+                self._focus_index -= sum(
+                    1 for iid, _ in rows[:max(focus, 0)] if iid in iids)
+        self._data_rows = kept
+        self._total_rows -= len(iids)
+        self._selected -= iids
+        self._render()
+        return True
+
+    def yview(self, *args):
+        """
+        Queries or changes the vertical position of the virtual window.
+
+        Accepts the same arguments Tk passes to a scrollbar command:
+        `('moveto', fraction)` and `('scroll', count, 'units' | 'pages')`.
+
+        Returns:
+            tuple: The visible `(first, last)` fractions of the whole data
+            set when called without arguments.
+        """
+        if not args:
+            return self._view_fractions()
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * self._total_rows))
+        elif args[0] == 'scroll':
+            step = self._visible_rows if args[2] == 'pages' else 1
+            self._scroll_to(self._top_index + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        """
+        Scrolls the virtual window with the mouse wheel.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.yview('scroll', -self._WHEEL_STEP, 'units')
+        else:
+            self.yview('scroll', self._WHEEL_STEP, 'units')
+        return 'break'
+
+    def _on_click(self, event):
+        """
+        Selects the clicked row only and makes it the focus row, like Tk's
+        own binding for clicks on a row.
+        """
+        if self.identify_region(event.x, event.y) not in ('tree', 'cell'):
+            return None
+        self.focus_set()
+        row = self._row_at(event.y)
+        if row is not None:
+            self._focus_index, iid = row
+            self._set_selection((iid,))
+        return 'break'
+
+    def _on_shift_click(self, event):
+        """
+        Selects every row between the focus row and the clicked row, even
+        if some of them are scrolled out of view.
+        """
+        row = self._row_at(event.y)
+        if row is None:
+            return 'break'
+        index, iid = row
+        if self._focus_index is None:
+            self._focus_index = index
+            self._set_selection((iid,))
+        else:
+            self._select_range(self._focus_index, index)
+        return 'break'
+
+    def _on_toggle_click(self, event):
+        """
+        Adds the clicked row to the selection or removes it from it.
+        """
+        row = self._row_at(event.y)
+        if row is not None:
+            self._set_selection(self._selected ^ {row[1]})
+        return 'break'
+
+    def _on_navigate(self, event):
+        """
+        Moves the focus row with the arrow, Page Up/Down, Home and End keys
+        and selects it, scrolling the virtual window to keep it in view.
+
+        The focus row is selected by `_render` once it is rendered, since
+        its page may still have to be fetched.
+        """
+        if not self._total_rows:
+            return 'break'
+        page = self._visible_rows
+        step = {'Up': -1, 'Down': 1, 'Prior': -page, 'Next': page,
+                'Home': -self._total_rows, 'End': self._total_rows}
+        step = step[event.keysym]
+        if self._focus_index is None:
+            index = self._top_index
+        else:
+            index = max(0, min(self._focus_index + step,
+                               self._total_rows - 1))
+            if event.keysym in ('Prior', 'Next'):
+                self._top_index += step
+        self._top_index = max(index - page + 1,
+                              min(self._top_index, index))
+        self._focus_index = index
+        self._focus_pending = True
+        self._range_request = None
+        self._render()
+        return 'break'
+
+    def _row_at(self, y):
+        """
+        Returns the `(index, iid)` of the rendered row at the given height,
+        or None if there is no row there.
+        """
+        iid = self.identify_row(y)
+        if not iid:
+            return None
+        return self._rendered_top + list(self._rendered_rows).index(iid), iid
+
+    def _select_range(self, first, last):
+        """
+        Selects the rows from index `first` to `last`, inclusive.
+
+        Rows outside the buffered page are requested from the main window,
+        and the range is selected when they arrive unless the selection was
+        changed in the meantime.
+        """
+        first, last = sorted((first, last))
+        offset = first - self._buffer_start
+        rows = self._data_rows or ()
+        if offset >= 0 and last - self._buffer_start < len(rows):
+            self._set_selection(
+                iid for iid, _ in rows[offset:last - self._buffer_start + 1])
+            return
+        self._range_request = (first, last)
+        self.main_window.request_rows(
+            first, last - first + 1,
+            functools.partial(self._on_range_fetched, first, last))
+
+    def _on_range_fetched(self, first, last, rows):
+        """
+        Selects the rows fetched for `_select_range`.
+        """
+        if self._range_request == (first, last):
+            self._set_selection(row[0] for row in rows)
+
+    def _set_selection(self, iids):
+        """
+        Replaces the selection and shows it on the rendered rows.
+        """
+        self._selected = set(iids)
+        self._range_request = None
+        self._focus_pending = False
+        self.selection_set([iid for iid in self._rendered_rows
+                            if iid in self._selected])
+
+    def _on_configure(self, event):
+        """
+        Fits the virtual window to the new height of the widget.
+        """
+        self._fit_pending = True
+        self._fit_rows()
+
+    def _fit_rows(self):
+        """
+        Sets the number of rows in the virtual window to the number of rows
+        that fit in the widget, and re-renders if it changed.
+
+        The heading and row heights are measured from the bounding box of
+        the first rendered row, so this waits until a row is on screen.
+        Tk's own view is kept at the top, since scrolling is done by moving
+        the virtual window instead.
+        """
+        if not self._rendered_rows:
+            return
+        ttk.Treeview.yview(self, 'moveto', 0)
+        bbox = self.bbox(next(iter(self._rendered_rows)))
+        if not bbox:
+            return
+        self._fit_pending = False
+        border, heading_height, _, row_height = bbox
+        rows = max(1, (self.winfo_height() - heading_height - border)
+                   // row_height)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._render()
+
+    def _scroll_to(self, index):
+        """
+        Moves the top of the virtual window to the given row index.
+        """
+        index = max(0, min(index, self._total_rows - self._visible_rows))
+        if index != self._top_index:
+            self._top_index = index
+            self._render()
+
+    def _view_fractions(self):
+        """
+        Returns the visible `(first, last)` fractions of the data set.
+        """
+        total = self._total_rows
+        if not total:
+            return 0.0, 1.0
+        last = min(self._top_index + self._visible_rows, total)
+        return self._top_index / total, last / total
+
+    def _ensure_page(self):
+        """
+        Checks whether the current window is entirely inside the buffered
+        page, and requests the page that holds it if not.
+
+        Pages start at a multiple of the window size and hold several
+        windows, so scrolling only queries the database every few screens.
+        A page already requested is not requested again, and a page that
+        failed to load is only retried once the window has moved to another
+        page.
+
+        Returns:
+            bool: True if the buffered page holds the current window.
+        """
+        window_end = min(self._top_index + self._visible_rows,
+                         self._total_rows)
+        if (self._data_rows is not None
+                and self._buffer_start <= self._top_index
+                and window_end <= self._buffer_start + len(self._data_rows)):
+            return True
+        start, limit = self.page_bounds()
+        if self._page_request != start:
+            self._page_request = start
+            self.main_window.request_rows(
+                start, limit, functools.partial(self._on_page_fetched, start))
+        return False
+
+    def _on_page_fetched(self, start, rows):
+        """
+        Buffers a page requested by `_ensure_page` and renders the window,
+        unless another page was requested or a result set loaded since.
+        """
+        if self._page_request != start:
+            return
+        self._page_request = None
+        self._buffer_start = start
+        self._data_rows = [(row[0], row[1:]) for row in rows]
+        self._render()
+
+    def _render(self):
+        """
+        Brings the Tk items in line with the rows of the current window.
+
+        Instead of deleting every item and inserting the window again, the
+        new window is diffed against the rows already rendered: items that
+        left the window are deleted in one call, new rows are inserted at
+        their position, rows whose values changed are edited in place and
+        rows that only changed position are moved. Items that survive keep
+        their selection, and the selection is added to inserted rows that
+        were selected before they left the window. The inserts, edits and
+        moves are sent to Tcl as one script, and the displayed columns are
+        hidden while the items change, so Tk redraws the widget once.
+
+        If the rows of the window are not buffered yet, the rendered rows
+        are left as they are until `_on_page_fetched` renders them.
+        """
+        self._top_index = max(0, min(
+            self._top_index, self._total_rows - self._visible_rows))
+        if not self._ensure_page():
+            self.y_scroll.set(*self._view_fractions())
+            return
+        window_start = self._top_index - self._buffer_start
+        window = dict(self._data_rows[
+            window_start:window_start + self._visible_rows])
+        rendered = self._rendered_rows
+
+        display_columns = self['displaycolumns']
+        self['displaycolumns'] = ()
+        try:
+            widget = self._w
+            removed = [iid for iid in rendered if iid not in window]
+            if removed:
+                self.tk.call(widget, 'delete', removed)
+            order = [iid for iid in rendered if iid in window]
+            script = []
+            add = script.append
+            reselect = []
+            for index, (iid, values) in enumerate(window.items()):
+                if iid not in rendered:
+                    add(f'{widget} insert {{}} {index} -id {_tcl_quote(iid)} '
+                        f'-values [list {" ".join(map(_tcl_quote, values))}]')
+                    order.insert(index, iid)
+                    if iid in self._selected:
+                        reselect.append(iid)
+                    continue
+                if rendered[iid] != values:
+                    add(f'{widget} item {_tcl_quote(iid)} '
+                        f'-values [list {" ".join(map(_tcl_quote, values))}]')
+                if order[index] != iid:
+                    add(f'{widget} move {_tcl_quote(iid)} {{}} {index}')
+                    order.remove(iid)
+                    order.insert(index, iid)
+            if script:
+                self.tk.eval('\n'.join(script))
+            if reselect:
+                self.selection_add(reselect)
+        finally:
+            self['displaycolumns'] = display_columns
+
+        self._rendered_rows = window
+        self._rendered_top = self._top_index
+        if (self._focus_pending and
+                0 <= self._focus_index - self._top_index < len(window)):
+            self._set_selection((self._data_rows[
+                self._focus_index - self._buffer_start][0],))
+        self.y_scroll.set(*self._view_fractions())
+        if self._fit_pending:
+            self._fit_rows()
 
 
 class InfoDisplay:
@@ -484,7 +1324,8 @@ class InfoDisplay:
     A class to manage a `ttk.Label` widget for displaying status messages.
 
     It provides methods to update the text, change its color, and automatically
-    clear the message after a set duration.
+    clear the message after a set duration. The widgets are only created
+    when the first message is shown.
     """
 
     def __init__(self, master):
@@ -494,10 +1335,10 @@ class InfoDisplay:
         Args:
             master (tk.Widget): The parent widget for the InfoDisplay.
         """
-        display_frame = Frame(master, text='Info', side='top', expand=False)
-        self.label = ttk.Label(display_frame, text='Display')
-        self.label.pack()
+        self.master = master
+        self.label = None
         self.clear_job = None
+        self._last_fg = None
 
     def update_text(self, text, foreground, duration_ms=None):
         """
@@ -512,8 +1353,10 @@ class InfoDisplay:
         if self.clear_job:
             self.label.after_cancel(self.clear_job)
             self.clear_job = None
+        if self.label is None:
+            self._build()
 
-        self.label.config(text=text, foreground=foreground)
+        self._paint(text, foreground)
         if duration_ms:
             self.clear_job = self.label.after(duration_ms, self._clear_message)
 
@@ -521,18 +1364,53 @@ class InfoDisplay:
         """
         Immediately clears the displayed message from the label.
         """
+        if self.label is None:
+            return
         if self.clear_job:
             self.label.after_cancel(self.clear_job)
             self.clear_job = None
-        self.label.config(text='', foreground='black')
+        self._paint('', 'black')
+
+    def shows(self, text):
+        """
+        Checks whether the label currently displays the given message.
+
+        Args:
+            text (str): The message to compare with.
+
+        Returns:
+            bool: True if the message is displayed.
+        """
+        return (self.label is not None
+                and str(self.label.cget('text')) == text)
+
+    def _build(self):
+        """
+        Creates the frame and label used to display messages.
+        """
+        display_frame = Frame(self.master, text='Info', side='top',
+                              expand=False)
+        self.label = ttk.Label(display_frame)
+        self.label.pack()
 
     def _clear_message(self):
         """
         Helper method to clear the message after a delay.
         """
-        self.label.config(text='', foreground='black')
+        self._paint('', 'black')
         self.clear_job = None
 
+    def _paint(self, text, foreground):
+        """
+        Sets the label's text, and its color only if it changed since the
+        last message.
+        """
+        if foreground == self._last_fg:
+            self.label['text'] = text
+        else:
+            self.label.configure(text=text, foreground=foreground)
+            self._last_fg = foreground
+
 
 class Button(ttk.Button):
     """
@@ -587,6 +1465,9 @@ class Frame(ttk.LabelFrame):
 class Entry(ttk.Entry):
     """
     A wrapper class for `ttk.Entry` to simplify creation and packing.
+
+    Attributes:
+        var (tk.StringVar): The variable linked to the entry's content.
     """
 
     def __init__(self, master, text='', side='top', expand=False, width='40',
@@ -604,10 +1485,11 @@ class Entry(ttk.Entry):
             padx (int, optional): Horizontal padding.
             pady (int, optional): Vertical padding.
             textvariable (tk.StringVar, optional): A variable linked to the
-                entry's content.
+                entry's content. A new one is created if omitted.
         """
         self.frame = Frame(master, text=text, side=side, expand=expand)
-        super().__init__(self.frame, width=width, textvariable=textvariable)
+        self.var = textvariable or tk.StringVar(self.frame)
+        super().__init__(self.frame, width=width, textvariable=self.var)
         self.pack(padx=padx, pady=pady)
 
 
@@ -619,3 +1501,11 @@ class GUIValidationError(Exception):
     def __init__(self, message="Invalid input provided."):
         self.message = message
         super().__init__(self.message)
+
+
+_DEFAULT_ERROR_FORMAT = 'An unexpected error occurred: {}'
+_ERROR_FORMATS = {
+    GUIValidationError: 'Input Error: {}',
+    DatabaseError: 'Database Error: {}',
+    Exception: _DEFAULT_ERROR_FORMAT,
+}
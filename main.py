@@ -10,3 +10,5 @@ config_manager = ConfigManager()
 root = MainWindow('Inventory App', db_manager, config_manager)
 
 root.mainloop()
+
+db_manager.close()